@@ -1,7 +1,7 @@
 from PyQt5.QtCore import Qt, QRect, QTimer, pyqtSlot
 from PyQt5.QtWidgets import QWidget
 from PyQt5.QtGui import QPainter, QColor, QFont, QPen, QBrush
-from typing import List, Optional
+from typing import Optional, Sequence
 from .groove import DrumGroove, DrumNote
 
 
@@ -38,7 +38,7 @@ class DrumStaffWidget(QWidget):
         self.staff_line_spacing = 12  # Pixels between staff lines
 
         # Active notes (currently playing)
-        self.active_notes: List[DrumNote] = []
+        self.active_notes: Sequence[DrumNote] = ()
 
         # Animation timer for smooth scrolling
         self.animation_timer = QTimer()
@@ -63,8 +63,17 @@ class DrumStaffWidget(QWidget):
             self.current_subdivision = subdivision
             self.update()
 
-    @pyqtSlot(list)
-    def set_active_notes(self, notes: List[DrumNote]):
+    def set_step(self, bar: int, step: int, steps_per_beat: int):
+        """
+        Update the playback position from the engine's step within the bar.
+        Use this rather than the tick's beat index, which already points at the
+        next beat on off-beat steps.
+        """
+        steps_per_beat = max(1, steps_per_beat)
+        self.set_position(bar, step // steps_per_beat, step % steps_per_beat)
+
+    @pyqtSlot(object)
+    def set_active_notes(self, notes: Sequence[DrumNote]):
         """Set which notes are currently playing (for highlighting)."""
         self.active_notes = notes
         self.update()
@@ -106,6 +115,17 @@ class DrumStaffWidget(QWidget):
         }
         return symbol_map.get(voice, '●')
 
+    def _active_step(self) -> int:
+        """Step within the bar whose notes are currently sounding (-1 = none)."""
+        if not (self.is_playing and self.active_notes and self.current_groove):
+            return -1
+        # Position and notes arrive on separate signals, so only highlight when the notes
+        # really are the ones at the playhead (the routine emits the groove's own per-step tuples)
+        notes_here = self.current_groove.get_notes_at_position(0, self.current_beat, self.current_subdivision)
+        if self.active_notes is not notes_here:
+            return -1
+        return self.current_beat * self.current_groove.subdivision + self.current_subdivision
+
     def _draw_staff_lines(self, painter: QPainter, x: int, y_center: int, width: int):
         """Draw the 5-line staff."""
         painter.setPen(QPen(self.staff_color, 1))
@@ -130,15 +150,16 @@ class DrumStaffWidget(QWidget):
             y = y_center + position * self.staff_line_spacing
             painter.drawText(x - 50, y - 8, 45, 16, Qt.AlignRight | Qt.AlignVCenter, label)
 
-    def _draw_note(self, painter: QPainter, x: int, y_center: int, note: DrumNote, is_active: bool = False):
+    def _draw_note(self, painter: QPainter, x: int, y_center: int, voice: str, accent: bool,
+                   is_active: bool = False):
         """Draw a single note on the staff."""
-        y_pos = self._get_voice_position(note.voice)
+        y_pos = self._get_voice_position(voice)
         y = y_center + y_pos * self.staff_line_spacing
 
         # Choose color
         if is_active:
             color = QColor("#00ff00")  # Green for active
-        elif note.accent:
+        elif accent:
             color = self.accent_color
         else:
             color = self.note_color
@@ -147,13 +168,13 @@ class DrumStaffWidget(QWidget):
         font = QFont("Arial", 14, QFont.Bold)
         painter.setFont(font)
 
-        symbol = self._get_voice_symbol(note.voice)
+        symbol = self._get_voice_symbol(voice)
 
         # Draw the symbol
         painter.drawText(x - 6, y - 10, 12, 20, Qt.AlignCenter, symbol)
 
         # Draw accent mark if needed (> symbol above note)
-        if note.accent and not is_active:
+        if accent and not is_active:
             accent_font = QFont("Arial", 10, QFont.Bold)
             painter.setFont(accent_font)
             painter.drawText(x - 5, y - 22, 10, 12, Qt.AlignCenter, ">")
@@ -253,6 +274,10 @@ class DrumStaffWidget(QWidget):
 
         # Draw bar lines and notes
         subdivisions_per_bar = self.current_groove.beats_per_bar * self.current_groove.subdivision
+        active_step = self._active_step()
+
+        # Notes don't track bars, so every visible bar shows the same note columns
+        steps, voices, accents = self.current_groove.get_note_columns()
 
         for bar in range(self.bars_visible):
             # Bar line
@@ -260,35 +285,11 @@ class DrumStaffWidget(QWidget):
             self._draw_bar_lines(painter, bar_x, y_center)
 
             # Draw notes for this bar
-            for beat in range(self.current_groove.beats_per_bar):
-                for subdiv in range(self.current_groove.subdivision):
-                    # Calculate x position
-                    position_in_visible = (
-                        bar * subdivisions_per_bar +
-                        beat * self.current_groove.subdivision +
-                        subdiv
-                    )
-                    note_x = int(staff_x + position_in_visible * subdivision_width + subdivision_width / 2)
-
-                    # Get notes at this position
-                    # For a static display, always show bars 0, 1, 2, etc. of the groove
-                    # (not relative to current_bar)
-                    notes = self.current_groove.get_notes_at_position(
-                        bar % self.current_groove.bars,
-                        beat,
-                        subdiv
-                    )
-
-                    # Draw each note
-                    for note in notes:
-                        is_active = (
-                            self.is_playing and
-                            bar == 0 and
-                            beat == self.current_beat and
-                            subdiv == self.current_subdivision and
-                            note in self.active_notes
-                        )
-                        self._draw_note(painter, note_x, y_center, note, is_active)
+            for i, step in enumerate(steps):
+                position_in_visible = bar * subdivisions_per_bar + step
+                note_x = int(staff_x + position_in_visible * subdivision_width + subdivision_width / 2)
+                is_active = bar == 0 and step == active_step
+                self._draw_note(painter, note_x, y_center, voices[i], accents[i], is_active)
 
         # Final bar line
         final_bar_x = int(staff_x + self.bars_visible * subdivisions_per_bar * subdivision_width)
@@ -1,11 +1,17 @@
+import traceback
+
 from PyQt5.QtCore import QObject, QTimer, pyqtSignal, Qt, QElapsedTimer, pyqtSlot
 
 
 class MetronomeEngine(QObject):
+    # Connection types: `click` should be connected with Qt.DirectConnection to
+    # the audio object living in the engine's thread so sound fires without an
+    # event-loop hop; UI slots (tick, bpmChanged, ...) use Qt.QueuedConnection.
     tick = pyqtSignal(int, int, bool, bool)  # step_index, beat_index, is_beat, is_accent
     click = pyqtSignal(bool)  # is_accent (emitted when a sound should play)
     barAdvanced = pyqtSignal(int)  # bar_index
     bpmChanged = pyqtSignal(int)
+    meterChanged = pyqtSignal(int, int)  # beats_per_bar, subdivision
     runningChanged = pyqtSignal(bool)
 
     def __init__(self, parent=None):
@@ -66,6 +72,7 @@ class MetronomeEngine(QObject):
         if beats != self._beats_per_bar:
             self._beats_per_bar = beats
             self._reset_counters()
+            self.meterChanged.emit(self._beats_per_bar, self._subdivision)
 
     @property
     def subdivision(self) -> int:
@@ -78,6 +85,21 @@ class MetronomeEngine(QObject):
             self._subdivision = subdiv
             self._recompute_interval()
             self._reset_counters()
+            self.meterChanged.emit(self._beats_per_bar, self._subdivision)
+
+    @pyqtSlot(int, int)
+    def configure(self, beats: int, subdiv: int):
+        """Apply meter and subdivision together with a single counter reset."""
+        beats = max(1, min(12, int(beats)))
+        subdiv = max(1, min(12, int(subdiv)))
+        if beats == self._beats_per_bar and subdiv == self._subdivision:
+            return
+        self._beats_per_bar = beats
+        if subdiv != self._subdivision:
+            self._subdivision = subdiv
+            self._recompute_interval()
+        self._reset_counters()
+        self.meterChanged.emit(self._beats_per_bar, self._subdivision)
 
     @property
     def accent_on_one(self) -> bool:
@@ -137,60 +159,68 @@ class MetronomeEngine(QObject):
         
         # High-resolution nanoseconds for precise scheduling
         self._step_ns = int((60_000_000_000) / (self._bpm * subdiv))
+        # bpm and subdivision are clamped, so the step is always positive
+        assert self._step_ns > 0
         
         # If running, we do NOT reset next_due_ns here.
         # We allow the existing timer/loop to pick up the new step size naturally.
         # This prevents phase jumps and double-scheduling when set_bpm is called inside a tick.
 
     def _on_timeout(self):
-        try:
-            if not self._running:
-                return
-            steps_per_bar = self._beats_per_bar * self._subdivision
-            is_beat = (self._step_index % self._subdivision) == 0
-            # Accent decision based on current beat BEFORE incrementing
-            current_beat = self._beat_index
-            is_first_beat = is_beat and current_beat == 0
-            is_accent = self._accent_on_one and is_first_beat
+        if not self._running:
+            return
+        steps_per_bar = self._beats_per_bar * self._subdivision
+        is_beat = (self._step_index % self._subdivision) == 0
+        # Accent decision based on current beat BEFORE incrementing
+        current_beat = self._beat_index
+        is_first_beat = is_beat and current_beat == 0
+        is_accent = self._accent_on_one and is_first_beat
+
+        # Check for mute training (Gap Click)
+        is_muted = False
+        if self._mute_bars_off > 0:
+            cycle = self._mute_bars_on + self._mute_bars_off
+            if (self._bar_index % cycle) >= self._mute_bars_on:
+                is_muted = True
 
+        try:
             self.tick.emit(self._step_index, current_beat, is_beat, is_accent)
 
             # Emit click signal for audio handling (decoupled from UI)
-            if is_beat or self._subdivision > 1:
-                # Check for mute training (Gap Click)
-                is_muted = False
-                if self._mute_bars_off > 0:
-                    cycle = self._mute_bars_on + self._mute_bars_off
-                    if (self._bar_index % cycle) >= self._mute_bars_on:
-                        is_muted = True
-                
-                if not is_muted:
-                    self.click.emit(is_accent)
-
-            # Advance counters AFTER emitting
-            if is_beat:
-                self._beat_index = (self._beat_index + 1) % self._beats_per_bar
-            self._step_index += 1
-            if self._step_index >= steps_per_bar:
-                self._step_index = 0
-                self._beat_index = 0
-                self._bar_index += 1
-                self.barAdvanced.emit(self._bar_index)
-
-            # Compute and schedule next precise timeout with drift compensation
-            now_ns = self._clock.nsecsElapsed()
-            # Advance next_due by exactly one step duration from previous target
-            self._next_due_ns += self._step_ns
-            # If we fell behind by more than one step, jump ahead but do not spam multiple ticks
-            if self._next_due_ns <= now_ns:
-                # place it at now + small lead to catch the next grid cleanly
-                missed = (now_ns - self._next_due_ns) // max(1, self._step_ns) + 1
-                self._next_due_ns += missed * self._step_ns
-            self._schedule_next(now_ns)
+            if (is_beat or self._subdivision > 1) and not is_muted:
+                self.click.emit(is_accent)
         except Exception as e:
-            print(f"Error in metronome engine: {e}")
-            import traceback
-            traceback.print_exc()
+            self._report_error(e)
+
+        # Advance counters AFTER emitting
+        if is_beat:
+            self._beat_index = (self._beat_index + 1) % self._beats_per_bar
+        self._step_index += 1
+        if self._step_index >= steps_per_bar:
+            self._step_index = 0
+            self._beat_index = 0
+            self._bar_index += 1
+            try:
+                self.barAdvanced.emit(self._bar_index)
+            except Exception as e:
+                self._report_error(e)
+
+        # Compute and schedule next precise timeout with drift compensation
+        now_ns = self._clock.nsecsElapsed()
+        step_ns = self._step_ns
+        # Advance next_due by exactly one step duration from previous target
+        self._next_due_ns += step_ns
+        # If we fell behind by more than one step, jump ahead to the next grid point
+        # in one go rather than spamming catch-up ticks
+        delta = now_ns - self._next_due_ns
+        if delta >= 0:
+            self._next_due_ns += (delta // step_ns + 1) * step_ns
+        self._schedule_next(now_ns)
+
+    def _report_error(self, e: Exception):
+        # A failing slot must not stop the clock; log it and keep ticking
+        print(f"Error in metronome engine: {e}")
+        traceback.print_exc()
 
     def _schedule_next(self, now_ns: int):
         delay_ns = max(0, self._next_due_ns - now_ns)
@@ -215,6 +245,7 @@ class TempoLadderRoutine(QObject):
         self._bars_per_step = 4
 
         self._bar_counter = 0
+        self._connected = False
 
     @pyqtSlot(int, int, int, int)
     def configure(self, start_bpm: int, end_bpm: int, step_bpm: int, bars_per_step: int):
@@ -234,14 +265,10 @@ class TempoLadderRoutine(QObject):
         # Set initial BPM
         self._engine.set_bpm(self._start_bpm)
 
-        # Connect to bar signal
-        # Avoid duplicate connection if safe, but disconnect/connect is safer
-        try:
-            self._engine.barAdvanced.disconnect(self._on_bar_advanced)
-        except TypeError:
-            pass  # wasn't connected
-
-        self._engine.barAdvanced.connect(self._on_bar_advanced)
+        # Connect to bar signal (tracked so we never double-connect)
+        if not self._connected:
+            self._engine.barAdvanced.connect(self._on_bar_advanced, Qt.UniqueConnection)
+            self._connected = True
 
         self.stateChanged.emit(True)
 
@@ -251,10 +278,9 @@ class TempoLadderRoutine(QObject):
             return
 
         self._running = False
-        try:
+        if self._connected:
             self._engine.barAdvanced.disconnect(self._on_bar_advanced)
-        except TypeError:
-            pass
+            self._connected = False
 
         self.stateChanged.emit(False)
 
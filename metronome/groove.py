@@ -1,14 +1,44 @@
-from dataclasses import dataclass
-from typing import List, Dict
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Callable, List, Dict, Tuple, Optional
 import random
 import json
 import os
+import sys
 from pathlib import Path
-from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot
+from PyQt5.QtCore import Qt, QObject, QStringListModel, pyqtSignal, pyqtSlot
 from .engine import MetronomeEngine
 
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the stdlib parser
+    orjson = None
 
-@dataclass
+
+def _json_loads(raw: bytes):
+    """Parse groove JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_dumps(data) -> bytes:
+    """Serialize groove JSON (2-space indent), using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+# Canonical voice strings; notes share these objects so voice comparisons hit
+# the identity fast path even for names that came from JSON
+_VOICE_INTERN: Dict[str, str] = {
+    v: sys.intern(v) for v in ('kick', 'snare', 'hihat', 'ride', 'crash', 'tom1', 'tom2', 'tom3')
+}
+
+
+@dataclass(slots=True)
 class DrumNote:
     """Represents a single drum hit in a groove."""
     voice: str  # 'kick', 'snare', 'hihat', 'ride', 'crash', 'tom1', 'tom2', 'tom3'
@@ -16,12 +46,26 @@ class DrumNote:
     subdivision: int  # Which subdivision of the beat (0-indexed)
     accent: bool = False  # Whether this note is accented
 
+    def __post_init__(self):
+        self.voice = _VOICE_INTERN.get(self.voice, self.voice)
+
     def get_absolute_position(self, subdivisions_per_beat: int) -> int:
         """Get the absolute position within a bar."""
         return self.beat * subdivisions_per_beat + self.subdivision
 
 
-@dataclass
+# Shared empty result for steps without notes (never mutated)
+_NO_NOTES: Tuple[DrumNote, ...] = ()
+
+
+@lru_cache(maxsize=512)
+def _sanitize_filename(name: str) -> str:
+    """File name a groove is stored under (alphanumerics, spaces, '_' and '-' only)."""
+    filename = "".join(c for c in name if c.isalnum() or c in (' ', '_', '-')).rstrip()
+    return filename.replace(' ', '_') + '.json'
+
+
+@dataclass(slots=True)
 class DrumGroove:
     """Represents a complete drum groove/pattern."""
     name: str
@@ -30,19 +74,72 @@ class DrumGroove:
     bars: int = 1
     subdivision: int = 4  # How many subdivisions per beat (4 = 16th notes)
 
-    def get_notes_at_position(self, bar: int, beat: int, subdivision: int) -> List[DrumNote]:
-        """Get all notes that should play at a specific position."""
-        # Normalize position to the pattern length
-        bar = bar % self.bars
-
-        # Only return notes if we're in the right bar and position
-        result = []
+    # Derived lookup caches, filled by _build_note_cache (not part of the groove's identity)
+    _step_table: Tuple[Tuple[DrumNote, ...], ...] = field(default=(), init=False, repr=False, compare=False)
+    _note_columns: Optional[Tuple[array, List[str], bytearray]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        self._build_note_cache()
+
+    def _build_note_cache(self):
+        """Index notes by step within the bar so lookups are a single list index."""
+        # Work on locals only; this runs for every groove at load and after every edit
+        beats = self.beats_per_bar
+        sub = self.subdivision
+        table = [_NO_NOTES] * (beats * sub)
         for note in self.notes:
-            # For single-bar patterns, ignore bar parameter
-            # For multi-bar patterns, we'd need to track which bar each note belongs to
-            if note.beat == beat and note.subdivision == subdivision:
-                result.append(note)
-        return result
+            beat = note.beat
+            subdiv = note.subdivision
+            if 0 <= beat < beats and 0 <= subdiv < sub:
+                table[beat * sub + subdiv] += (note,)
+        # Frozen: the table is shared with playback schedules for the groove's own meter
+        self._step_table = tuple(table)
+        # Built on first use; only the groove shown on the staff ever needs them
+        self._note_columns = None
+
+    def get_note_columns(self) -> Tuple[array, List[str], bytearray]:
+        """Parallel (step, voice, accent) arrays for every note, ordered by step.
+
+        Meant for code that scans every note, such as the staff renderer.
+        """
+        if self._note_columns is None:
+            steps = array('i')
+            voices: List[str] = []
+            accents = bytearray()
+            for step, notes in enumerate(self._step_table):
+                for note in notes:
+                    steps.append(step)
+                    voices.append(note.voice)
+                    accents.append(1 if note.accent else 0)
+            self._note_columns = (steps, voices, accents)
+        return self._note_columns
+
+    @property
+    def filename(self) -> str:
+        """Sanitized JSON file name used when saving this groove."""
+        return _sanitize_filename(self.name)
+
+    def get_notes_at_position(self, bar: int, beat: int, subdivision: int) -> Tuple[DrumNote, ...]:
+        """Get all notes that should play at a specific position."""
+        # Notes don't track which bar they belong to, so every bar of the pattern
+        # plays the same notes and the bar index needs no normalization here
+        if 0 <= beat < self.beats_per_bar and 0 <= subdivision < self.subdivision:
+            return self._step_table[beat * self.subdivision + subdivision]
+        return _NO_NOTES
+
+    def get_step_schedule(self, beats_per_bar: int, subdivision: int) -> Tuple[Tuple[DrumNote, ...], ...]:
+        """
+        Notes to play at each step of a bar played in the given meter.
+        Entry i holds the notes at beat i // subdivision, subdivision i % subdivision.
+        """
+        if beats_per_bar == self.beats_per_bar and subdivision == self.subdivision:
+            return self._step_table
+        return tuple(
+            self.get_notes_at_position(0, step // subdivision, step % subdivision)
+            for step in range(beats_per_bar * subdivision)
+        )
 
     def to_dict(self) -> Dict:
         """Serialize to dictionary for JSON storage."""
@@ -83,346 +180,460 @@ class DrumGroove:
         )
 
 
+def _build_basic_rock() -> DrumGroove:
+    """Basic Rock Beat (8th note hi-hat, kick on 1 and 3, snare on 2 and 4)."""
+    return DrumGroove(
+        name="Basic Rock Beat",
+        beats_per_bar=4,
+        bars=1,
+        subdivision=2,  # 8th notes
+        notes=[
+            # Hi-hat 8th notes
+            DrumNote('hihat', 0, 0), DrumNote('hihat', 0, 1),
+            DrumNote('hihat', 1, 0), DrumNote('hihat', 1, 1),
+            DrumNote('hihat', 2, 0), DrumNote('hihat', 2, 1),
+            DrumNote('hihat', 3, 0), DrumNote('hihat', 3, 1),
+            # Kick on 1 and 3
+            DrumNote('kick', 0, 0, accent=True),
+            DrumNote('kick', 2, 0),
+            # Snare on 2 and 4
+            DrumNote('snare', 1, 0, accent=True),
+            DrumNote('snare', 3, 0, accent=True),
+        ]
+    )
+
+
+def _build_rock_variations() -> DrumGroove:
+    """Rock with Kick Variations (16th note hi-hat)."""
+    return DrumGroove(
+        name="Rock with Kick Variations",
+        beats_per_bar=4,
+        bars=1,
+        subdivision=4,  # 16th notes
+        notes=[
+            # Hi-hat 8th notes (on 16th grid)
+            DrumNote('hihat', 0, 0), DrumNote('hihat', 0, 2),
+            DrumNote('hihat', 1, 0), DrumNote('hihat', 1, 2),
+            DrumNote('hihat', 2, 0), DrumNote('hihat', 2, 2),
+            DrumNote('hihat', 3, 0), DrumNote('hihat', 3, 2),
+            # Kick with variations
+            DrumNote('kick', 0, 0, accent=True),
+            DrumNote('kick', 1, 3),  # "and" of 2
+            DrumNote('kick', 2, 0),
+            DrumNote('kick', 3, 2),  # "e" of 4
+            # Snare on 2 and 4
+            DrumNote('snare', 1, 0, accent=True),
+            DrumNote('snare', 3, 0, accent=True),
+        ]
+    )
+
+
+def _build_motown() -> DrumGroove:
+    """Motown Groove (hi-hat on quarters, detailed kick pattern)."""
+    return DrumGroove(
+        name="Motown Groove",
+        beats_per_bar=4,
+        bars=1,
+        subdivision=4,
+        notes=[
+            # Hi-hat on quarter notes
+            DrumNote('hihat', 0, 0, accent=True),
+            DrumNote('hihat', 1, 0, accent=True),
+            DrumNote('hihat', 2, 0, accent=True),
+            DrumNote('hihat', 3, 0, accent=True),
+            # Syncopated kick
+            DrumNote('kick', 0, 0, accent=True),
+            DrumNote('kick', 1, 2),
+            DrumNote('kick', 2, 1),
+            DrumNote('kick', 3, 3),
+            # Snare on 2 and 4
+            DrumNote('snare', 1, 0, accent=True),
+            DrumNote('snare', 3, 0, accent=True),
+        ]
+    )
+
+
+def _build_jazz_swing() -> DrumGroove:
+    """Jazz Swing (ride pattern with swing feel)."""
+    return DrumGroove(
+        name="Jazz Swing Pattern",
+        beats_per_bar=4,
+        bars=1,
+        subdivision=3,  # Triplet feel
+        notes=[
+            # Ride cymbal swing pattern (ding-ding-a)
+            DrumNote('ride', 0, 0, accent=True), DrumNote('ride', 0, 2),
+            DrumNote('ride', 1, 0, accent=True), DrumNote('ride', 1, 2),
+            DrumNote('ride', 2, 0, accent=True), DrumNote('ride', 2, 2),
+            DrumNote('ride', 3, 0, accent=True), DrumNote('ride', 3, 2),
+            # Hi-hat on 2 and 4
+            DrumNote('hihat', 1, 0),
+            DrumNote('hihat', 3, 0),
+            # Sparse kick
+            DrumNote('kick', 0, 0),
+            DrumNote('kick', 2, 1),
+        ]
+    )
+
+
+def _build_linear() -> DrumGroove:
+    """Linear Groove."""
+    return DrumGroove(
+        name="Linear Groove",
+        beats_per_bar=4,
+        bars=1,
+        subdivision=4,
+        notes=[
+            # Beat 1
+            DrumNote('kick', 0, 0, accent=True),
+            DrumNote('hihat', 0, 1),
+            DrumNote('snare', 0, 2),
+            DrumNote('hihat', 0, 3),
+            # Beat 2
+            DrumNote('kick', 1, 0),
+            DrumNote('hihat', 1, 1),
+            DrumNote('snare', 1, 2, accent=True),
+            DrumNote('hihat', 1, 3),
+            # Beat 3
+            DrumNote('kick', 2, 0),
+            DrumNote('hihat', 2, 1),
+            DrumNote('snare', 2, 2),
+            DrumNote('hihat', 2, 3),
+            # Beat 4
+            DrumNote('kick', 3, 0),
+            DrumNote('hihat', 3, 1),
+            DrumNote('snare', 3, 2, accent=True),
+            DrumNote('kick', 3, 3),
+        ]
+    )
+
+
+def _build_basic_fill() -> DrumGroove:
+    """Basic Fill (16th note tom pattern)."""
+    return DrumGroove(
+        name="Basic Tom Fill",
+        beats_per_bar=4,
+        bars=1,
+        subdivision=4,
+        notes=[
+            # First 3 beats: basic pattern
+            DrumNote('hihat', 0, 0), DrumNote('hihat', 0, 2),
+            DrumNote('kick', 0, 0, accent=True),
+            DrumNote('hihat', 1, 0), DrumNote('hihat', 1, 2),
+            DrumNote('snare', 1, 0, accent=True),
+            DrumNote('hihat', 2, 0), DrumNote('hihat', 2, 2),
+            DrumNote('kick', 2, 0),
+            # Beat 4: fill
+            DrumNote('tom1', 3, 0, accent=True),
+            DrumNote('tom1', 3, 1),
+            DrumNote('tom2', 3, 2),
+            DrumNote('tom3', 3, 3),
+        ]
+    )
+
+
+def _build_halftime() -> DrumGroove:
+    """Half-time Groove."""
+    return DrumGroove(
+        name="Half-time Groove",
+        beats_per_bar=4,
+        bars=1,
+        subdivision=4,
+        notes=[
+            # Hi-hat 16ths
+            DrumNote('hihat', 0, 0), DrumNote('hihat', 0, 1),
+            DrumNote('hihat', 0, 2), DrumNote('hihat', 0, 3),
+            DrumNote('hihat', 1, 0), DrumNote('hihat', 1, 1),
+            DrumNote('hihat', 1, 2), DrumNote('hihat', 1, 3),
+            DrumNote('hihat', 2, 0), DrumNote('hihat', 2, 1),
+            DrumNote('hihat', 2, 2), DrumNote('hihat', 2, 3),
+            DrumNote('hihat', 3, 0), DrumNote('hihat', 3, 1),
+            DrumNote('hihat', 3, 2), DrumNote('hihat', 3, 3),
+            # Kick on 1
+            DrumNote('kick', 0, 0, accent=True),
+            # Snare on 3 (half-time feel)
+            DrumNote('snare', 2, 0, accent=True),
+        ]
+    )
+
+
+def _build_shuffle() -> DrumGroove:
+    """Shuffle Pattern."""
+    return DrumGroove(
+        name="Shuffle Pattern",
+        beats_per_bar=4,
+        bars=1,
+        subdivision=3,  # Triplet subdivision
+        notes=[
+            # Shuffle hi-hat (long-short pattern)
+            DrumNote('hihat', 0, 0, accent=True), DrumNote('hihat', 0, 2),
+            DrumNote('hihat', 1, 0), DrumNote('hihat', 1, 2),
+            DrumNote('hihat', 2, 0, accent=True), DrumNote('hihat', 2, 2),
+            DrumNote('hihat', 3, 0), DrumNote('hihat', 3, 2),
+            # Kick on 1 and 3
+            DrumNote('kick', 0, 0, accent=True),
+            DrumNote('kick', 2, 0),
+            # Snare on 2 and 4
+            DrumNote('snare', 1, 0, accent=True),
+            DrumNote('snare', 3, 0, accent=True),
+        ]
+    )
+
+
+def _build_paradiddle() -> DrumGroove:
+    """Paradiddle Groove."""
+    return DrumGroove(
+        name="Paradiddle Groove",
+        beats_per_bar=4,
+        bars=1,
+        subdivision=4,
+        notes=[
+            # Paradiddle on hi-hat/snare (RLRR LRLL pattern)
+            # Beat 1: R(hihat) L(snare) R(hihat) R(snare)
+            DrumNote('hihat', 0, 0, accent=True),
+            DrumNote('snare', 0, 1),
+            DrumNote('hihat', 0, 2),
+            DrumNote('snare', 0, 3),
+            # Beat 2: L(snare) R(hihat) L(snare) L(snare)
+            DrumNote('snare', 1, 0, accent=True),
+            DrumNote('hihat', 1, 1),
+            DrumNote('snare', 1, 2),
+            DrumNote('snare', 1, 3),
+            # Beat 3: repeat
+            DrumNote('hihat', 2, 0),
+            DrumNote('snare', 2, 1),
+            DrumNote('hihat', 2, 2),
+            DrumNote('snare', 2, 3),
+            # Beat 4: repeat
+            DrumNote('snare', 3, 0),
+            DrumNote('hihat', 3, 1),
+            DrumNote('snare', 3, 2),
+            DrumNote('snare', 3, 3),
+            # Kick pattern underneath
+            DrumNote('kick', 0, 0, accent=True),
+            DrumNote('kick', 2, 0),
+        ]
+    )
+
+
+# Preset grooves, built on first request (name -> factory), in library order
+_PRESET_FACTORIES: Dict[str, Callable[[], DrumGroove]] = {
+    "Basic Rock Beat": _build_basic_rock,
+    "Rock with Kick Variations": _build_rock_variations,
+    "Motown Groove": _build_motown,
+    "Jazz Swing Pattern": _build_jazz_swing,
+    "Linear Groove": _build_linear,
+    "Basic Tom Fill": _build_basic_fill,
+    "Half-time Groove": _build_halftime,
+    "Shuffle Pattern": _build_shuffle,
+    "Paradiddle Groove": _build_paradiddle,
+}
+
+
 class GrooveLibrary:
     """Manages a library of preset and custom drum grooves."""
 
     def __init__(self):
-        self.grooves: List[DrumGroove] = []
+        # Name -> groove, in library order (presets first, then custom).
+        # Presets map to None until they are first requested.
+        self._grooves_by_key: "OrderedDict[str, Optional[DrumGroove]]" = OrderedDict()
+        # Views derived from the store; rebuilt lazily after a mutation
+        self._grooves: Optional[List[DrumGroove]] = None
+        self._names: Optional[Tuple[str, ...]] = None
+        self._name_model: Optional[QStringListModel] = None  # Shared by groove combo boxes
+        self._grooves_dir: Optional[Path] = None  # Resolved (and created) on first use
         self._init_presets()
         self._load_custom_grooves()
 
-    def _init_presets(self):
-        """Initialize the preset groove library."""
-        # Basic Rock Beat (8th note hi-hat, kick on 1 and 3, snare on 2 and 4)
-        basic_rock = DrumGroove(
-            name="Basic Rock Beat",
-            beats_per_bar=4,
-            bars=1,
-            subdivision=2,  # 8th notes
-            notes=[
-                # Hi-hat 8th notes
-                DrumNote('hihat', 0, 0), DrumNote('hihat', 0, 1),
-                DrumNote('hihat', 1, 0), DrumNote('hihat', 1, 1),
-                DrumNote('hihat', 2, 0), DrumNote('hihat', 2, 1),
-                DrumNote('hihat', 3, 0), DrumNote('hihat', 3, 1),
-                # Kick on 1 and 3
-                DrumNote('kick', 0, 0, accent=True),
-                DrumNote('kick', 2, 0),
-                # Snare on 2 and 4
-                DrumNote('snare', 1, 0, accent=True),
-                DrumNote('snare', 3, 0, accent=True),
-            ]
-        )
-
-        # Rock with Kick Variations (16th note hi-hat)
-        rock_variations = DrumGroove(
-            name="Rock with Kick Variations",
-            beats_per_bar=4,
-            bars=1,
-            subdivision=4,  # 16th notes
-            notes=[
-                # Hi-hat 8th notes (on 16th grid)
-                DrumNote('hihat', 0, 0), DrumNote('hihat', 0, 2),
-                DrumNote('hihat', 1, 0), DrumNote('hihat', 1, 2),
-                DrumNote('hihat', 2, 0), DrumNote('hihat', 2, 2),
-                DrumNote('hihat', 3, 0), DrumNote('hihat', 3, 2),
-                # Kick with variations
-                DrumNote('kick', 0, 0, accent=True),
-                DrumNote('kick', 1, 3),  # "and" of 2
-                DrumNote('kick', 2, 0),
-                DrumNote('kick', 3, 2),  # "e" of 4
-                # Snare on 2 and 4
-                DrumNote('snare', 1, 0, accent=True),
-                DrumNote('snare', 3, 0, accent=True),
-            ]
-        )
-
-        # Motown Groove (hi-hat on quarters, detailed kick pattern)
-        motown = DrumGroove(
-            name="Motown Groove",
-            beats_per_bar=4,
-            bars=1,
-            subdivision=4,
-            notes=[
-                # Hi-hat on quarter notes
-                DrumNote('hihat', 0, 0, accent=True),
-                DrumNote('hihat', 1, 0, accent=True),
-                DrumNote('hihat', 2, 0, accent=True),
-                DrumNote('hihat', 3, 0, accent=True),
-                # Syncopated kick
-                DrumNote('kick', 0, 0, accent=True),
-                DrumNote('kick', 1, 2),
-                DrumNote('kick', 2, 1),
-                DrumNote('kick', 3, 3),
-                # Snare on 2 and 4
-                DrumNote('snare', 1, 0, accent=True),
-                DrumNote('snare', 3, 0, accent=True),
-            ]
-        )
-
-        # Jazz Swing (ride pattern with swing feel)
-        jazz_swing = DrumGroove(
-            name="Jazz Swing Pattern",
-            beats_per_bar=4,
-            bars=1,
-            subdivision=3,  # Triplet feel
-            notes=[
-                # Ride cymbal swing pattern (ding-ding-a)
-                DrumNote('ride', 0, 0, accent=True), DrumNote('ride', 0, 2),
-                DrumNote('ride', 1, 0, accent=True), DrumNote('ride', 1, 2),
-                DrumNote('ride', 2, 0, accent=True), DrumNote('ride', 2, 2),
-                DrumNote('ride', 3, 0, accent=True), DrumNote('ride', 3, 2),
-                # Hi-hat on 2 and 4
-                DrumNote('hihat', 1, 0),
-                DrumNote('hihat', 3, 0),
-                # Sparse kick
-                DrumNote('kick', 0, 0),
-                DrumNote('kick', 2, 1),
-            ]
-        )
-
-        # Linear Groove
-        linear = DrumGroove(
-            name="Linear Groove",
-            beats_per_bar=4,
-            bars=1,
-            subdivision=4,
-            notes=[
-                # Beat 1
-                DrumNote('kick', 0, 0, accent=True),
-                DrumNote('hihat', 0, 1),
-                DrumNote('snare', 0, 2),
-                DrumNote('hihat', 0, 3),
-                # Beat 2
-                DrumNote('kick', 1, 0),
-                DrumNote('hihat', 1, 1),
-                DrumNote('snare', 1, 2, accent=True),
-                DrumNote('hihat', 1, 3),
-                # Beat 3
-                DrumNote('kick', 2, 0),
-                DrumNote('hihat', 2, 1),
-                DrumNote('snare', 2, 2),
-                DrumNote('hihat', 2, 3),
-                # Beat 4
-                DrumNote('kick', 3, 0),
-                DrumNote('hihat', 3, 1),
-                DrumNote('snare', 3, 2, accent=True),
-                DrumNote('kick', 3, 3),
-            ]
-        )
-
-        # Basic Fill (16th note tom pattern)
-        basic_fill = DrumGroove(
-            name="Basic Tom Fill",
-            beats_per_bar=4,
-            bars=1,
-            subdivision=4,
-            notes=[
-                # First 3 beats: basic pattern
-                DrumNote('hihat', 0, 0), DrumNote('hihat', 0, 2),
-                DrumNote('kick', 0, 0, accent=True),
-                DrumNote('hihat', 1, 0), DrumNote('hihat', 1, 2),
-                DrumNote('snare', 1, 0, accent=True),
-                DrumNote('hihat', 2, 0), DrumNote('hihat', 2, 2),
-                DrumNote('kick', 2, 0),
-                # Beat 4: fill
-                DrumNote('tom1', 3, 0, accent=True),
-                DrumNote('tom1', 3, 1),
-                DrumNote('tom2', 3, 2),
-                DrumNote('tom3', 3, 3),
-            ]
-        )
-
-        # Half-time Groove
-        halftime = DrumGroove(
-            name="Half-time Groove",
-            beats_per_bar=4,
-            bars=1,
-            subdivision=4,
-            notes=[
-                # Hi-hat 16ths
-                DrumNote('hihat', 0, 0), DrumNote('hihat', 0, 1),
-                DrumNote('hihat', 0, 2), DrumNote('hihat', 0, 3),
-                DrumNote('hihat', 1, 0), DrumNote('hihat', 1, 1),
-                DrumNote('hihat', 1, 2), DrumNote('hihat', 1, 3),
-                DrumNote('hihat', 2, 0), DrumNote('hihat', 2, 1),
-                DrumNote('hihat', 2, 2), DrumNote('hihat', 2, 3),
-                DrumNote('hihat', 3, 0), DrumNote('hihat', 3, 1),
-                DrumNote('hihat', 3, 2), DrumNote('hihat', 3, 3),
-                # Kick on 1
-                DrumNote('kick', 0, 0, accent=True),
-                # Snare on 3 (half-time feel)
-                DrumNote('snare', 2, 0, accent=True),
-            ]
-        )
-
-        # Shuffle Pattern
-        shuffle = DrumGroove(
-            name="Shuffle Pattern",
-            beats_per_bar=4,
-            bars=1,
-            subdivision=3,  # Triplet subdivision
-            notes=[
-                # Shuffle hi-hat (long-short pattern)
-                DrumNote('hihat', 0, 0, accent=True), DrumNote('hihat', 0, 2),
-                DrumNote('hihat', 1, 0), DrumNote('hihat', 1, 2),
-                DrumNote('hihat', 2, 0, accent=True), DrumNote('hihat', 2, 2),
-                DrumNote('hihat', 3, 0), DrumNote('hihat', 3, 2),
-                # Kick on 1 and 3
-                DrumNote('kick', 0, 0, accent=True),
-                DrumNote('kick', 2, 0),
-                # Snare on 2 and 4
-                DrumNote('snare', 1, 0, accent=True),
-                DrumNote('snare', 3, 0, accent=True),
-            ]
-        )
-
-        # Paradiddle Groove
-        paradiddle = DrumGroove(
-            name="Paradiddle Groove",
-            beats_per_bar=4,
-            bars=1,
-            subdivision=4,
-            notes=[
-                # Paradiddle on hi-hat/snare (RLRR LRLL pattern)
-                # Beat 1: R(hihat) L(snare) R(hihat) R(snare)
-                DrumNote('hihat', 0, 0, accent=True),
-                DrumNote('snare', 0, 1),
-                DrumNote('hihat', 0, 2),
-                DrumNote('snare', 0, 3),
-                # Beat 2: L(snare) R(hihat) L(snare) L(snare)
-                DrumNote('snare', 1, 0, accent=True),
-                DrumNote('hihat', 1, 1),
-                DrumNote('snare', 1, 2),
-                DrumNote('snare', 1, 3),
-                # Beat 3: repeat
-                DrumNote('hihat', 2, 0),
-                DrumNote('snare', 2, 1),
-                DrumNote('hihat', 2, 2),
-                DrumNote('snare', 2, 3),
-                # Beat 4: repeat
-                DrumNote('snare', 3, 0),
-                DrumNote('hihat', 3, 1),
-                DrumNote('snare', 3, 2),
-                DrumNote('snare', 3, 3),
-                # Kick pattern underneath
-                DrumNote('kick', 0, 0, accent=True),
-                DrumNote('kick', 2, 0),
-            ]
-        )
+    @property
+    def grooves(self) -> List[DrumGroove]:
+        """All grooves in library order (builds any presets not yet requested)."""
+        if self._grooves is None:
+            # Building a preset resets the cache, so assign only once all are built
+            grooves = [self._get_by_key(key) for key in list(self._grooves_by_key)]
+            self._grooves = grooves
+        return self._grooves
 
-        self.grooves = [
-            basic_rock,
-            rock_variations,
-            motown,
-            jazz_swing,
-            linear,
-            basic_fill,
-            halftime,
-            shuffle,
-            paradiddle,
-        ]
+    def _init_presets(self):
+        """Register the preset grooves without building them."""
+        for name in _PRESET_FACTORIES:
+            self._grooves_by_key[name] = None
+
+    def _get_by_key(self, key: str) -> Optional[DrumGroove]:
+        """Look up a groove by name, building a preset on first use."""
+        # Building mutates the store without locking, so the library is GUI-thread only
+        groove = self._grooves_by_key.get(key)
+        if groove is None and key in self._grooves_by_key:
+            groove = _PRESET_FACTORIES[key]()
+            self._grooves_by_key[key] = groove
+            self._grooves = None
+        return groove
 
     def _get_custom_grooves_path(self) -> Path:
         """Get the path to custom grooves directory."""
-        home = Path.home()
-        grooves_dir = home / '.drummetronome' / 'grooves'
-        grooves_dir.mkdir(parents=True, exist_ok=True)
-        return grooves_dir
+        if self._grooves_dir is None:
+            grooves_dir = Path.home() / '.drummetronome' / 'grooves'
+            grooves_dir.mkdir(parents=True, exist_ok=True)
+            self._grooves_dir = grooves_dir
+        return self._grooves_dir
 
     def _load_custom_grooves(self):
         """Load custom grooves from user directory."""
         grooves_dir = self._get_custom_grooves_path()
-        for file_path in grooves_dir.glob('*.json'):
+        # scandir exposes the entry type without an extra stat per file
+        with os.scandir(grooves_dir) as it:
+            entries = sorted(
+                (e for e in it if e.name.endswith('.json') and e.is_file()),
+                key=lambda e: e.name
+            )
+        for entry in entries:
+            file_path = entry.path
             try:
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
-                    groove = DrumGroove.from_dict(data)
-                    self.grooves.append(groove)
-            except Exception as e:
+                with open(file_path, 'rb') as f:
+                    data = _json_loads(f.read())
+                groove = DrumGroove.from_dict(data)
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                # Unreadable file, invalid JSON, or JSON that isn't a groove
                 print(f"Failed to load groove from {file_path}: {e}")
+                continue
+            self._upsert_groove(groove)
 
     def save_groove(self, groove: DrumGroove):
         """Save a custom groove to disk."""
-        grooves_dir = self._get_custom_grooves_path()
-        # Sanitize filename
-        filename = "".join(c for c in groove.name if c.isalnum() or c in (' ', '_', '-')).rstrip()
-        filename = filename.replace(' ', '_') + '.json'
-        file_path = grooves_dir / filename
-
         try:
-            with open(file_path, 'w') as f:
-                json.dump(groove.to_dict(), f, indent=2)
-
-            # Add to library if not already present
-            if groove not in self.grooves:
-                self.grooves.append(groove)
+            self.write_groove_file(groove)
+            # Add to library, replacing any existing groove with the same name
+            self._upsert_groove(groove)
         except Exception as e:
             print(f"Failed to save groove: {e}")
             raise
 
+    def write_groove_file(self, groove: DrumGroove):
+        """
+        Write a custom groove's file without adding it to the library.
+        Touches only the disk, so it may run off the GUI thread; follow with add_groove().
+        """
+        grooves_dir = self._get_custom_grooves_path()
+        file_path = grooves_dir / groove.filename
+
+        # Write to a temp file and swap it in so a crash mid-write never leaves a partial groove
+        tmp_path = file_path.with_suffix('.json.tmp')
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(_json_dumps(groove.to_dict()))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, file_path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+    def add_groove(self, groove: DrumGroove):
+        """Add a groove, replacing any existing groove with the same name."""
+        self._upsert_groove(groove)
+
     def delete_groove(self, groove: DrumGroove):
         """Delete a custom groove (presets cannot be deleted)."""
-        if groove in self.grooves:
+        if self._grooves_by_key.get(groove.name) is groove:
             # Only delete if it's a custom groove (has file on disk)
             grooves_dir = self._get_custom_grooves_path()
-            filename = "".join(c for c in groove.name if c.isalnum() or c in (' ', '_', '-')).rstrip()
-            filename = filename.replace(' ', '_') + '.json'
-            file_path = grooves_dir / filename
+            file_path = grooves_dir / groove.filename
 
             if file_path.exists():
                 file_path.unlink()
-                self.grooves.remove(groove)
+                self._remove_groove(groove)
                 return True
         return False
 
-    def get_groove_names(self) -> List[str]:
-        """Get list of all groove names."""
-        return [g.name for g in self.grooves]
+    def _upsert_groove(self, groove: DrumGroove):
+        """Add a groove, or replace the existing groove with the same name in place."""
+        name = groove.name
+        is_new = name not in self._grooves_by_key
+        # Assigning an existing key keeps its position in the OrderedDict
+        self._grooves_by_key[name] = groove
+        self._grooves = None
+        if is_new:
+            self._names = None
+            model = self._name_model
+            if model is not None:
+                # Append just the new row: a model reset would clear every combo box's selection
+                row = model.rowCount()
+                model.insertRows(row, 1)
+                model.setData(model.index(row), name)
+
+    def _remove_groove(self, groove: DrumGroove):
+        """Remove a groove from the library."""
+        row = list(self._grooves_by_key).index(groove.name)
+        del self._grooves_by_key[groove.name]
+        self._grooves = None
+        self._names = None
+        if self._name_model is not None:
+            # Model rows follow library order, so the groove's row is its position
+            self._name_model.removeRows(row, 1)
+
+    def get_groove_names(self) -> Tuple[str, ...]:
+        """Get all groove names (cached, rebuilt only when the library changes)."""
+        if self._names is None:
+            self._names = tuple(
+                g.name if g is not None else key
+                for key, g in self._grooves_by_key.items()
+            )
+        return self._names
+
+    def get_name_model(self) -> QStringListModel:
+        """Get a list model of the groove names, kept in sync with the library."""
+        if self._name_model is None:
+            self._name_model = QStringListModel(list(self.get_groove_names()))
+        return self._name_model
 
     def get_groove_by_name(self, name: str) -> DrumGroove:
         """Get a groove by name."""
-        for g in self.grooves:
-            if g.name == name:
-                return g
-        return None
+        return self._get_by_key(name)
 
 
 class GrooveRoutine(QObject):
     """Manages playing drum grooves synchronized with the metronome engine."""
 
     grooveChanged = pyqtSignal(object)  # DrumGroove
-    notesPlaying = pyqtSignal(list)  # List[DrumNote] - notes at current position
+    notesPlaying = pyqtSignal(object)  # Sequence[DrumNote] - notes at current position
     activeChanged = pyqtSignal(bool)
 
-    def __init__(self, engine: MetronomeEngine, library: GrooveLibrary, parent=None):
+    def __init__(self, engine: MetronomeEngine, parent=None):
         super().__init__(parent)
         self._engine = engine
-        self._library = library
         self._running = False
 
         self._current_groove = None
+        self._schedule: Tuple[Tuple[DrumNote, ...], ...] = ()  # step in bar -> notes to play
         self._bar_in_groove = 0
         self._loop_count = 0  # 0 = infinite
         self._bars_played = 0
+        self._connected = False
+        self._last_notes_empty = True  # Only emit a clear when the display actually shows notes
+
+        # The meter can still be changed from the main window during playback; both objects
+        # live on the worker thread, so the schedule is rebuilt before the next tick
+        self._engine.meterChanged.connect(self._on_meter_changed)
 
     @property
     def running(self):
         return self._running
 
-    @pyqtSlot(str)
-    def set_groove(self, groove_name: str):
-        """Set the current groove by name."""
-        groove = self._library.get_groove_by_name(groove_name)
+    @pyqtSlot(object)
+    def set_groove(self, groove: DrumGroove):
+        """
+        Set the current groove.
+        Takes the groove rather than a name: the library builds presets lazily and is only
+        touched from the GUI thread, while this runs on the engine's worker thread.
+        """
         if groove:
             self._current_groove = groove
             self.grooveChanged.emit(groove)
 
-            # Update engine settings to match groove
-            if groove.beats_per_bar != self._engine.beats_per_bar:
-                self._engine.set_beats_per_bar(groove.beats_per_bar)
-            if groove.subdivision != self._engine.subdivision:
-                self._engine.set_subdivision(groove.subdivision)
+            # Update engine settings to match groove (rebuilds the schedule via meterChanged
+            # when the meter changes; the engine may already be in it, so build here as well)
+            self._engine.configure(groove.beats_per_bar, groove.subdivision)
+            self._on_meter_changed(self._engine.beats_per_bar, self._engine.subdivision)
 
     @pyqtSlot(int)
     def set_loop_count(self, count: int):
@@ -438,19 +649,13 @@ class GrooveRoutine(QObject):
         self._running = True
         self._bar_in_groove = 0
         self._bars_played = 0
+        self._last_notes_empty = True
 
-        # Connect to engine signals
-        try:
-            self._engine.tick.disconnect(self._on_tick)
-        except TypeError:
-            pass
-        try:
-            self._engine.barAdvanced.disconnect(self._on_bar_advanced)
-        except TypeError:
-            pass
-
-        self._engine.tick.connect(self._on_tick)
-        self._engine.barAdvanced.connect(self._on_bar_advanced)
+        # Connect to engine signals (tracked so we never double-connect)
+        if not self._connected:
+            self._engine.tick.connect(self._on_tick, Qt.UniqueConnection)
+            self._engine.barAdvanced.connect(self._on_bar_advanced, Qt.UniqueConnection)
+            self._connected = True
 
         self.activeChanged.emit(True)
 
@@ -462,17 +667,21 @@ class GrooveRoutine(QObject):
 
         self._running = False
 
-        try:
+        if self._connected:
             self._engine.tick.disconnect(self._on_tick)
-        except TypeError:
-            pass
-        try:
             self._engine.barAdvanced.disconnect(self._on_bar_advanced)
-        except TypeError:
-            pass
+            self._connected = False
 
         self.activeChanged.emit(False)
-        self.notesPlaying.emit([])  # Clear display
+        self.notesPlaying.emit(_NO_NOTES)  # Clear display
+        self._last_notes_empty = True
+
+    @pyqtSlot(int, int)
+    def _on_meter_changed(self, beats_per_bar: int, subdivision: int):
+        """Precompute the notes for every engine step of a bar in the engine's new meter."""
+        if self._current_groove:
+            # Notes carry no bar, so one bar of schedule covers the whole loop
+            self._schedule = self._current_groove.get_step_schedule(beats_per_bar, subdivision)
 
     @pyqtSlot(int, int, bool, bool)
     def _on_tick(self, step_idx: int, beat_idx: int, is_beat: bool, is_accent: bool):
@@ -480,22 +689,16 @@ class GrooveRoutine(QObject):
         if not self._running or not self._current_groove:
             return
 
-        # Calculate which subdivision we're on (based on engine's subdivision)
-        # step_idx is the step within the bar, so we need modulo to get subdivision within beat
-        subdivision_idx = step_idx % self._engine.subdivision
-
-        # Get notes at this position
-        notes = self._current_groove.get_notes_at_position(
-            self._bar_in_groove,
-            beat_idx,
-            subdivision_idx
-        )
+        # step_idx is the step within the bar; the schedule always covers the engine's meter
+        notes = self._schedule[step_idx]
 
         if notes:
             self.notesPlaying.emit(notes)
-        else:
-            # Clear notes display between hits
-            self.notesPlaying.emit([])
+            self._last_notes_empty = False
+        elif not self._last_notes_empty:
+            # Clear notes display between hits (once, not on every silent step)
+            self.notesPlaying.emit(_NO_NOTES)
+            self._last_notes_empty = True
 
     @pyqtSlot(int)
     def _on_bar_advanced(self, bar_idx: int):
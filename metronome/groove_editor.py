@@ -1,14 +1,30 @@
-from PyQt5.QtCore import Qt, pyqtSignal
+from contextlib import contextmanager
+from dataclasses import dataclass
+from PyQt5.QtCore import (
+    Qt, QObject, QThread, QTimer, QLineF, QRect, QRectF, QSize, QStringListModel,
+    QConcatenateTablesProxyModel, pyqtSignal, pyqtSlot
+)
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel, QPushButton,
     QComboBox, QSpinBox, QGroupBox, QWidget, QCheckBox, QScrollArea,
     QLineEdit, QMessageBox
 )
-from PyQt5.QtGui import QPainter, QColor, QPen, QBrush, QMouseEvent
+from PyQt5.QtGui import QPainter, QPainterPath, QColor, QPen, QBrush, QMouseEvent, QPixmap, QFont
 from typing import Dict, Tuple, Optional, List
 from .groove import DrumGroove, DrumNote, GrooveLibrary
 
 
+@contextmanager
+def _signals_blocked(*widgets: QWidget):
+    """Block the widgets' signals for the duration of the block, then restore them."""
+    previous = [widget.blockSignals(True) for widget in widgets]
+    try:
+        yield
+    finally:
+        for widget, was_blocked in zip(widgets, previous):
+            widget.blockSignals(was_blocked)
+
+
 class NoteGridWidget(QWidget):
     """
     A grid widget for programming drum notes.
@@ -17,19 +33,30 @@ class NoteGridWidget(QWidget):
 
     noteToggled = pyqtSignal(str, int, int, bool)  # voice, beat, subdivision, state
 
+    # Counting syllables for each subdivision of a beat (the beat itself is unlabelled)
+    _SUBDIV_LABELS = ('', 'e', '+', 'a')
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumSize(800, 400)
-
-        # Grid data: Dict[(voice, beat, subdiv)] = (enabled, accent)
-        self.notes: Dict[Tuple[str, int, int], Tuple[bool, bool]] = {}
+        # paintEvent covers every pixel from the background pixmap, and existing pixels
+        # stay valid on resize, so Qt needs neither to erase nor to repaint them
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WA_StaticContents, True)
 
         # Grid settings
         self.voices = ['crash', 'ride', 'hihat', 'tom1', 'snare', 'tom2', 'tom3', 'kick']
         self.voice_labels = ['Crash', 'Ride', 'Hi-Hat', 'Tom 1', 'Snare', 'Tom 2', 'Tom 3', 'Kick']
+        self._voice_idx: Dict[str, int] = {voice: i for i, voice in enumerate(self.voices)}
         self.beats_per_bar = 4
         self.subdivision = 4  # 16th notes by default
 
+        # Grid data: one byte per cell, indexed row * columns + col.
+        # A disabled cell keeps its accent byte so re-enabling restores it.
+        self._enabled = bytearray()
+        self._accent = bytearray()
+        self._reset_cells()
+
         # Colors
         self.bg_color = QColor("#1a1a1a")
         self.grid_color = QColor("#333333")
@@ -38,70 +65,145 @@ class NoteGridWidget(QWidget):
         self.beat_line_color = QColor("#555555")
         self.text_color = QColor("#e0e0e0")
 
+        # Painting resources, built once and reused by every paint
+        self._font_sub = QFont("Arial", 8)
+        self._font_label = QFont("Arial", 10)
+        self._font_accent = QFont("Arial", 10, QFont.Bold)
+        self._font_instr = QFont("Arial", 9)
+        self._pen_grid = QPen(self.grid_color, 1)
+        self._pen_beat = QPen(self.beat_line_color, 2)
+        self._pen_note = QPen(self.note_color, 2)
+        self._pen_accent = QPen(self.accent_color, 2)
+        self._brush_note = QBrush(self.note_color)
+        self._brush_accent = QBrush(self.accent_color)
+
         # Interaction
         self.cell_width = 30
         self.cell_height = 40
         self.label_width = 80
 
+        # Static grid (lines, headers, labels) rendered once and blitted on every paint
+        self._bg_pixmap: Optional[QPixmap] = None
+
+        # Cell edges in pixels (one more entry than columns/rows) and cell centre offsets
+        self._col_x: List[int] = []
+        self._row_y: List[int] = []
+        self._half_cw = self.cell_width // 2
+        self._half_ch = self.cell_height // 2
+
+        # Grid lines, grouped by pen so each group is a single drawLines() call
+        self._lines_thin: List[QLineF] = []
+        self._lines_thick: List[QLineF] = []
+        self._subdiv_label_items: List[Tuple[int, str]] = []
+        self._rebuild_geometry_cache()
+
+        self._cached_size_hint: Optional[QSize] = None
+
+        # Dimension changes only mark the geometry dirty; a zero-interval timer then
+        # rebuilds it and requests layout/paint once per burst of changes
+        self._geometry_dirty = False
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self._do_refresh)
+
+        # Drag painting: the button held, the value it writes, and the last cell visited
+        self._drag_button = None
+        self._drag_value = 0
+        self._last_cell: Optional[Tuple[str, int, int]] = None
+
+    def _reset_cells(self):
+        """Allocate empty cell arrays for the current grid dimensions."""
+        size = len(self.voices) * self.beats_per_bar * self.subdivision
+        self._enabled = bytearray(size)
+        self._accent = bytearray(size)
+
     def set_grid_size(self, beats: int, subdivision: int):
         """Set the grid dimensions."""
         self.beats_per_bar = beats
         self.subdivision = subdivision
-        self.notes.clear()
-        self.update()
-        self.updateGeometry()
+        self._reset_cells()
+        self._schedule_refresh()
 
     def load_groove(self, groove: DrumGroove):
         """Load notes from a groove."""
         self.beats_per_bar = groove.beats_per_bar
         self.subdivision = groove.subdivision
-        self.notes.clear()
+        self._reset_cells()
 
+        total_subdivs = self.beats_per_bar * self.subdivision
+        voice_idx = self._voice_idx
         for note in groove.notes:
-            key = (note.voice, note.beat, note.subdivision)
-            self.notes[key] = (True, note.accent)
+            row = voice_idx.get(note.voice)
+            if row is None:
+                continue
+            if not (0 <= note.beat < self.beats_per_bar and 0 <= note.subdivision < self.subdivision):
+                continue
+            idx = row * total_subdivs + note.beat * self.subdivision + note.subdivision
+            self._enabled[idx] = 1
+            self._accent[idx] = note.accent
 
-        self.update()
+        self._schedule_refresh()
+
+    def _schedule_refresh(self):
+        """Defer geometry rebuild, layout and repaint to the next event loop pass."""
+        self._geometry_dirty = True
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+
+    def _do_refresh(self):
+        self._ensure_geometry()
         self.updateGeometry()
+        self.update()
+
+    def _ensure_geometry(self):
+        """Rebuild the geometry caches if the grid dimensions changed since the last build."""
+        if self._geometry_dirty:
+            self._geometry_dirty = False
+            self._rebuild_geometry_cache()
+            self._bg_pixmap = None
+            self._cached_size_hint = None
 
     def get_groove_notes(self) -> List[DrumNote]:
         """Export current grid as DrumNote list."""
+        total_subdivs = self.beats_per_bar * self.subdivision
+        enabled = self._enabled
+        accents = self._accent
         notes = []
-        for (voice, beat, subdiv), (enabled, accent) in self.notes.items():
-            if enabled:
-                notes.append(DrumNote(voice, beat, subdiv, accent))
+        # bytearray.find skips runs of empty cells in C, so only enabled cells cost Python work
+        idx = enabled.find(1)
+        while idx != -1:
+            row, col = divmod(idx, total_subdivs)
+            beat, subdiv = divmod(col, self.subdivision)
+            notes.append(DrumNote(self.voices[row], beat, subdiv, bool(accents[idx])))
+            idx = enabled.find(1, idx + 1)
         return notes
 
     def clear_all(self):
         """Clear all notes."""
-        self.notes.clear()
+        self._reset_cells()
         self.update()
 
     def sizeHint(self):
-        total_subdivs = self.beats_per_bar * self.subdivision
-        width = self.label_width + total_subdivs * self.cell_width + 40
-        height = len(self.voices) * self.cell_height + 60
-        from PyQt5.QtCore import QSize
-        return QSize(width, height)
+        self._ensure_geometry()
+        if self._cached_size_hint is None:
+            total_subdivs = self.beats_per_bar * self.subdivision
+            width = self.label_width + total_subdivs * self.cell_width + 40
+            height = len(self.voices) * self.cell_height + 60
+            self._cached_size_hint = QSize(width, height)
+        return self._cached_size_hint
 
     def _get_cell_at_pos(self, x: int, y: int) -> Optional[Tuple[str, int, int]]:
         """Get the cell (voice, beat, subdivision) at pixel position."""
-        # Account for margins
-        x -= self.label_width + 20
-        y -= 40
-
-        if x < 0 or y < 0:
+        self._ensure_geometry()
+        # Reject clicks on labels, headers and margins before doing any division
+        grid_left = self._col_x[0]
+        grid_top = self._row_y[0]
+        if not (grid_left <= x < self._col_x[-1] and grid_top <= y < self._row_y[-1]):
             return None
 
-        col = x // self.cell_width
-        row = y // self.cell_height
-
-        if row < 0 or row >= len(self.voices):
-            return None
-
-        total_subdivs = self.beats_per_bar * self.subdivision
-        if col < 0 or col >= total_subdivs:
-            return None
+        col = (x - grid_left) // self.cell_width
+        row = (y - grid_top) // self.cell_height
 
         voice = self.voices[row]
         beat = col // self.subdivision
@@ -109,128 +211,272 @@ class NoteGridWidget(QWidget):
 
         return (voice, beat, subdiv)
 
+    def _cell_rect(self, row: int, col: int) -> QRect:
+        """Get the pixel rectangle of the cell at (row, col)."""
+        return QRect(self._col_x[col], self._row_y[row], self.cell_width, self.cell_height)
+
+    def _set_cell(self, cell: Tuple[str, int, int], button, value: int):
+        """Write value to the note (left button) or accent (right button) of a cell."""
+        voice, beat, subdiv = cell
+        row = self._voice_idx[voice]
+        col = beat * self.subdivision + subdiv
+        idx = row * self.beats_per_bar * self.subdivision + col
+
+        if button == Qt.LeftButton:
+            if self._enabled[idx] == value:
+                return
+            self._enabled[idx] = value
+        else:
+            # Accents only apply to existing notes
+            if not self._enabled[idx] or self._accent[idx] == value:
+                return
+            self._accent[idx] = value
+
+        # Only this cell changed, so only repaint this cell
+        self.update(self._cell_rect(row, col))
+
     def mousePressEvent(self, event: QMouseEvent):
         """Handle mouse clicks to toggle notes."""
+        self._drag_button = None
         cell = self._get_cell_at_pos(event.x(), event.y())
+        self._last_cell = cell
         if cell:
             voice, beat, subdiv = cell
-            key = (voice, beat, subdiv)
+            idx = (self._voice_idx[voice] * self.beats_per_bar * self.subdivision
+                   + beat * self.subdivision + subdiv)
 
             if event.button() == Qt.LeftButton:
-                # Toggle note on/off
-                if key in self.notes:
-                    enabled, accent = self.notes[key]
-                    self.notes[key] = (not enabled, accent)
-                else:
-                    self.notes[key] = (True, False)
-                self.update()
+                # Toggle note on/off; dragging then paints the same state
+                self._drag_value = self._enabled[idx] ^ 1
 
             elif event.button() == Qt.RightButton:
                 # Toggle accent (if note exists)
-                if key in self.notes:
-                    enabled, accent = self.notes[key]
-                    if enabled:
-                        self.notes[key] = (enabled, not accent)
-                        self.update()
+                if not self._enabled[idx]:
+                    return
+                self._drag_value = self._accent[idx] ^ 1
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
+            else:
+                return
 
-        # Fill background
-        painter.fillRect(self.rect(), self.bg_color)
+            self._drag_button = event.button()
+            self._set_cell(cell, self._drag_button, self._drag_value)
+
+    def mouseMoveEvent(self, event: QMouseEvent):
+        """Paint the press's note/accent state onto each cell entered while dragging."""
+        if self._drag_button is None:
+            return
+        cell = self._get_cell_at_pos(event.x(), event.y())
+        if cell is None or cell == self._last_cell:
+            return
+        self._last_cell = cell
+        self._set_cell(cell, self._drag_button, self._drag_value)
+
+    def mouseReleaseEvent(self, event: QMouseEvent):
+        if event.button() == self._drag_button:
+            self._drag_button = None
+            self._last_cell = None
 
+    def _rebuild_geometry_cache(self):
+        """Precompute cell positions and grid lines for the current grid dimensions."""
         margin_top = 40
         margin_left = self.label_width + 20
 
         total_subdivs = self.beats_per_bar * self.subdivision
-        grid_width = total_subdivs * self.cell_width
+        col_x = [margin_left + i * self.cell_width for i in range(total_subdivs + 1)]
+        row_y = [margin_top + i * self.cell_height for i in range(len(self.voices) + 1)]
+        self._col_x = col_x
+        self._row_y = row_y
+
+        # Horizontal lines (voice separators)
+        thin = []
+        for y in row_y:
+            thin.append(QLineF(col_x[0], y, col_x[-1], y))
+
+        # Vertical lines, thicker at beat boundaries
+        thick = []
+        for i, x in enumerate(col_x):
+            line = QLineF(x, row_y[0], x, row_y[-1])
+            if i % self.subdivision == 0:
+                thick.append(line)
+            else:
+                thin.append(line)
+
+        self._lines_thin = thin
+        self._lines_thick = thick
+
+        # Only the labelled subdivision columns, with their x position
+        labels = self._SUBDIV_LABELS[:self.subdivision]
+        self._subdiv_label_items = [
+            (col_x[beat_col + subdiv], label)
+            for beat_col in range(0, total_subdivs, self.subdivision)
+            for subdiv, label in enumerate(labels)
+            if label
+        ]
+
+    def resizeEvent(self, event):
+        # The instructions line spans the widget width, so the cached grid must be redrawn
+        self._bg_pixmap = None
+        super().resizeEvent(event)
+
+    def _rebuild_background(self):
+        """Render the static part of the grid into the background pixmap."""
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * dpr)
+        pixmap.setDevicePixelRatio(dpr)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        # Fill background
+        painter.fillRect(self.rect(), self.bg_color)
+
+        margin_top = 40
         grid_height = len(self.voices) * self.cell_height
 
         # Draw column headers (beat numbers)
         painter.setPen(self.text_color)
+        beat_width = self.subdivision * self.cell_width
         for beat in range(self.beats_per_bar):
-            x = margin_left + beat * self.subdivision * self.cell_width
-            painter.drawText(x, margin_top - 25, self.subdivision * self.cell_width, 20,
-                            Qt.AlignCenter, str(beat + 1))
+            x = self._col_x[beat * self.subdivision]
+            painter.drawText(x, margin_top - 25, beat_width, 20, Qt.AlignCenter, str(beat + 1))
 
         # Draw subdivision markers
-        from PyQt5.QtGui import QFont
-        font = QFont("Arial", 8)
-        painter.setFont(font)
-        for i in range(total_subdivs):
-            subdiv = i % self.subdivision
-            if subdiv > 0:  # Don't label the beat itself
-                x = margin_left + i * self.cell_width
-                subdiv_labels = {1: 'e', 2: '+', 3: 'a'}
-                label = subdiv_labels.get(subdiv, '')
-                if label:
-                    painter.drawText(x, margin_top - 10, self.cell_width, 10,
-                                    Qt.AlignCenter, label)
+        painter.setFont(self._font_sub)
+        for x, label in self._subdiv_label_items:
+            painter.drawText(x, margin_top - 10, self.cell_width, 10, Qt.AlignCenter, label)
 
         # Draw grid lines
-        painter.setPen(QPen(self.grid_color, 1))
-
-        # Horizontal lines (voice separators)
-        for i in range(len(self.voices) + 1):
-            y = margin_top + i * self.cell_height
-            painter.drawLine(margin_left, y, margin_left + grid_width, y)
-
-        # Vertical lines
-        for i in range(total_subdivs + 1):
-            x = margin_left + i * self.cell_width
-            # Thicker line at beat boundaries
-            if i % self.subdivision == 0:
-                painter.setPen(QPen(self.beat_line_color, 2))
-            else:
-                painter.setPen(QPen(self.grid_color, 1))
-            painter.drawLine(x, margin_top, x, margin_top + grid_height)
+        painter.setPen(self._pen_grid)
+        painter.drawLines(self._lines_thin)
+        painter.setPen(self._pen_beat)
+        painter.drawLines(self._lines_thick)
 
         # Draw voice labels
         painter.setPen(self.text_color)
-        font = QFont("Arial", 10)
-        painter.setFont(font)
+        painter.setFont(self._font_label)
         for i, label in enumerate(self.voice_labels):
             y = margin_top + i * self.cell_height
             painter.drawText(10, y, self.label_width, self.cell_height,
                             Qt.AlignVCenter | Qt.AlignRight, label)
 
-        # Draw notes
-        for (voice, beat, subdiv), (enabled, accent) in self.notes.items():
-            if not enabled:
-                continue
+        # Draw instructions at bottom
+        painter.setPen(self.text_color)
+        painter.setFont(self._font_instr)
+        instructions_y = margin_top + grid_height + 10
+        painter.drawText(10, instructions_y, self.width() - 20, 30, Qt.AlignLeft,
+                        "Left-click: Toggle note  |  Right-click: Toggle accent (red)")
 
-            voice_idx = self.voices.index(voice)
-            col = beat * self.subdivision + subdiv
+        painter.end()
+        self._bg_pixmap = pixmap
 
-            x = margin_left + col * self.cell_width
-            y = margin_top + voice_idx * self.cell_height
+    def paintEvent(self, event):
+        # Nothing on screen to update (dialog hidden, minimized or grid scrolled away)
+        if not self.isVisible() or self.visibleRegion().isEmpty():
+            return
 
-            # Draw filled circle for note
-            color = self.accent_color if accent else self.note_color
-            painter.setBrush(QBrush(color))
-            painter.setPen(QPen(color, 2))
+        self._ensure_geometry()
+        if self._bg_pixmap is None:
+            self._rebuild_background()
 
-            center_x = x + self.cell_width // 2
-            center_y = y + self.cell_height // 2
-            radius = 8
+        exposed = event.rect()
 
-            painter.drawEllipse(center_x - radius, center_y - radius, radius * 2, radius * 2)
+        # The widget painter is already clipped to the exposed region, so the blit
+        # only touches the dirty pixels
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._bg_pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
 
-            # Draw accent marker if needed
-            if accent:
-                painter.setPen(QPen(self.accent_color, 2))
-                font_accent = QFont("Arial", 10, QFont.Bold)
-                painter.setFont(font_accent)
-                painter.drawText(x, y + 5, self.cell_width, 15, Qt.AlignCenter, ">")
+        margin_top = 40
+        margin_left = self.label_width + 20
+        total_subdivs = self.beats_per_bar * self.subdivision
 
-        # Draw instructions at bottom
-        painter.setPen(self.text_color)
-        font = QFont("Arial", 9)
-        painter.setFont(font)
-        instructions_y = margin_top + grid_height + 10
-        painter.drawText(10, instructions_y, self.width() - 20, 30, Qt.AlignLeft,
-                        "Left-click: Toggle note  |  Right-click: Toggle accent (red)")
+        # Inside the scroll area the exposed rect never extends past the viewport,
+        # so only the cells it covers are visited, however long the grid is
+        first_col = max(0, (exposed.left() - margin_left) // self.cell_width)
+        last_col = min(total_subdivs - 1, (exposed.right() - margin_left) // self.cell_width)
+        first_row = max(0, (exposed.top() - margin_top) // self.cell_height)
+        last_row = min(len(self.voices) - 1, (exposed.bottom() - margin_top) // self.cell_height)
+        if first_col > last_col or first_row > last_row:
+            return
+
+        enabled = self._enabled
+        accents = self._accent
+        col_x = self._col_x
+        row_y = self._row_y
+        radius = 8
+
+        # Collect the note circles into one path per colour, then draw each path once
+        note_path = QPainterPath()
+        accent_path = QPainterPath()
+        accent_cells = []
+        for voice_idx in range(first_row, last_row + 1):
+            row_base = voice_idx * total_subdivs
+            center_y = row_y[voice_idx] + self._half_ch
+            for col in range(first_col, last_col + 1):
+                idx = row_base + col
+                if not enabled[idx]:
+                    continue
+                center_x = col_x[col] + self._half_cw
+                circle = QRectF(center_x - radius, center_y - radius, radius * 2, radius * 2)
+                if accents[idx]:
+                    accent_path.addEllipse(circle)
+                    accent_cells.append((col_x[col], row_y[voice_idx]))
+                else:
+                    note_path.addEllipse(circle)
+
+        painter.setBrush(self._brush_note)
+        painter.setPen(self._pen_note)
+        painter.drawPath(note_path)
+
+        painter.setBrush(self._brush_accent)
+        painter.setPen(self._pen_accent)
+        painter.drawPath(accent_path)
+
+        # Draw accent markers
+        painter.setFont(self._font_accent)
+        for x, y in accent_cells:
+            painter.drawText(x, y + 5, self.cell_width, 15, Qt.AlignCenter, ">")
+
+
+def _note_keys(notes: List[DrumNote]) -> Tuple[Tuple[str, int, int, bool], ...]:
+    """Order-independent, comparable form of a note list."""
+    return tuple(sorted((n.voice, n.beat, n.subdivision, bool(n.accent)) for n in notes))
+
+
+@dataclass(frozen=True)
+class _GrooveSnapshot:
+    """The editor's groove settings and notes, in a comparable form."""
+    name: str
+    beats_per_bar: int
+    bars: int
+    subdivision: int
+    notes: Tuple[Tuple[str, int, int, bool], ...]
+
+    @classmethod
+    def of(cls, groove: DrumGroove) -> '_GrooveSnapshot':
+        return cls(groove.name, groove.beats_per_bar, groove.bars, groove.subdivision,
+                   _note_keys(groove.notes))
+
+
+class _SaveWorker(QObject):
+    """Writes a groove file off the GUI thread."""
+
+    finished = pyqtSignal(object)  # DrumGroove
+    failed = pyqtSignal(str)
+
+    def __init__(self, library: GrooveLibrary, groove: DrumGroove):
+        super().__init__()
+        self._library = library
+        self._groove = groove
+
+    @pyqtSlot()
+    def run(self):
+        try:
+            self._library.write_groove_file(self._groove)
+        except Exception as e:
+            self.failed.emit(str(e))
+        else:
+            self.finished.emit(self._groove)
 
 
 class GrooveEditorDialog(QDialog):
@@ -245,6 +491,22 @@ class GrooveEditorDialog(QDialog):
         self.library = library
         self.current_groove = None
 
+        # Background save in flight, if any
+        self._save_thread: Optional[QThread] = None
+        self._save_worker: Optional[_SaveWorker] = None
+
+        # Spinbox/combo changes restart this; the grid is resized once the burst settles
+        self._settings_timer = QTimer(self)
+        self._settings_timer.setSingleShot(True)
+        self._settings_timer.setInterval(0)
+        self._settings_timer.timeout.connect(self._apply_settings)
+
+        # Arrow-keying through the groove list only loads the entry the selection settles on
+        self._groove_load_timer = QTimer(self)
+        self._groove_load_timer.setSingleShot(True)
+        self._groove_load_timer.setInterval(50)
+        self._groove_load_timer.timeout.connect(self._load_selected_groove)
+
         self.setWindowTitle("Groove Editor")
         self.setModal(True)
         self.resize(1000, 700)
@@ -303,8 +565,11 @@ class GrooveEditorDialog(QDialog):
         # Groove selection
         top_layout.addWidget(QLabel("Load Preset:"), 0, 0)
         self.groove_combo = QComboBox()
-        self.groove_combo.addItem("-- New Groove --")
-        self.groove_combo.addItems(self.library.get_groove_names())
+        # "-- New Groove --" followed by the library's shared name model
+        groove_model = QConcatenateTablesProxyModel(self)
+        groove_model.addSourceModel(QStringListModel(["-- New Groove --"], self))
+        groove_model.addSourceModel(self.library.get_name_model())
+        self.groove_combo.setModel(groove_model)
         self.groove_combo.currentTextChanged.connect(self._on_groove_selected)
         top_layout.addWidget(self.groove_combo, 0, 1)
 
@@ -329,6 +594,9 @@ class GrooveEditorDialog(QDialog):
         self.subdiv_combo.addItem("16th notes", 4)
         self.subdiv_combo.addItem("Triplets", 3)
         self.subdiv_combo.setCurrentIndex(1)  # Default to 16th
+        self._subdiv_index_by_data: Dict[int, int] = {
+            self.subdiv_combo.itemData(i): i for i in range(self.subdiv_combo.count())
+        }
         self.subdiv_combo.currentIndexChanged.connect(self._on_settings_changed)
         top_layout.addWidget(self.subdiv_combo, 1, 3)
 
@@ -378,6 +646,7 @@ class GrooveEditorDialog(QDialog):
     def _on_groove_selected(self, name: str):
         """Load a preset groove into the editor."""
         if name == "-- New Groove --":
+            self._groove_load_timer.stop()
             self._clear_grid()
             self.name_edit.clear()
             self.beats_spin.setValue(4)
@@ -385,27 +654,28 @@ class GrooveEditorDialog(QDialog):
             self.bars_spin.setValue(1)
             return
 
+        self._groove_load_timer.start()
+
+    def _load_selected_groove(self):
+        """Load the groove currently selected in the combo box."""
+        name = self.groove_combo.currentText()
+        if name == "-- New Groove --":
+            return
         groove = self.library.get_groove_by_name(name)
         if groove:
-            self.current_groove = groove
-            self.name_edit.setText(groove.name)
-            self.beats_spin.setValue(groove.beats_per_bar)
-
-            # Set subdivision combo
-            for i in range(self.subdiv_combo.count()):
-                if self.subdiv_combo.itemData(i) == groove.subdivision:
-                    self.subdiv_combo.setCurrentIndex(i)
-                    break
-
-            self.bars_spin.setValue(groove.bars)
-
-            # Load into grid
-            self.note_grid.load_groove(groove)
+            self.load_groove_for_editing(groove)
 
     def _on_settings_changed(self):
+        """Schedule a grid update; a burst of changes results in a single resize."""
+        self._settings_timer.start()
+
+    def _apply_settings(self):
         """Update grid when settings change."""
         beats = self.beats_spin.value()
         subdiv = self.subdiv_combo.currentData()
+        # Resizing clears the grid, so skip it when a burst ends on the current size
+        if (beats, subdiv) == (self.note_grid.beats_per_bar, self.note_grid.subdivision):
+            return
         self.note_grid.set_grid_size(beats, subdiv)
 
     def _clear_grid(self):
@@ -414,42 +684,94 @@ class GrooveEditorDialog(QDialog):
 
     def _save_groove(self):
         """Save the current groove."""
-        name = self.name_edit.text().strip()
-        if not name:
+        # Read all editor state once, up front
+        notes = self.note_grid.get_groove_notes()
+        snapshot = _GrooveSnapshot(
+            name=self.name_edit.text().strip(),
+            beats_per_bar=self.beats_spin.value(),
+            bars=self.bars_spin.value(),
+            subdivision=self.subdiv_combo.currentData(),
+            notes=_note_keys(notes),
+        )
+
+        if not snapshot.name:
             QMessageBox.warning(self, "Invalid Name", "Please enter a groove name.")
             return
 
-        notes = self.note_grid.get_groove_notes()
         if not notes:
             QMessageBox.warning(self, "Empty Groove", "Please add some notes to the groove.")
             return
 
+        # Nothing was edited since the groove was loaded: there is nothing to write
+        if self.current_groove is not None and _GrooveSnapshot.of(self.current_groove) == snapshot:
+            self.accept()
+            return
+
         groove = DrumGroove(
-            name=name,
+            name=snapshot.name,
             notes=notes,
-            beats_per_bar=self.beats_spin.value(),
-            bars=self.bars_spin.value(),
-            subdivision=self.subdiv_combo.currentData()
+            beats_per_bar=snapshot.beats_per_bar,
+            bars=snapshot.bars,
+            subdivision=snapshot.subdivision
         )
 
-        try:
-            self.library.save_groove(groove)
-            self.grooveSaved.emit(groove)
-            QMessageBox.information(self, "Success", f"Groove '{name}' saved successfully!")
-            self.accept()
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to save groove: {e}")
+        # Write the file on a worker thread; the result handlers run back on this thread
+        self.save_btn.setEnabled(False)
+        self.cancel_btn.setEnabled(False)
+        self._save_thread = QThread(self)
+        self._save_worker = _SaveWorker(self.library, groove)
+        self._save_worker.moveToThread(self._save_thread)
+        self._save_thread.started.connect(self._save_worker.run)
+        self._save_worker.finished.connect(self._on_save_finished)
+        self._save_worker.failed.connect(self._on_save_failed)
+        self._save_thread.start()
+
+    def _finish_save_thread(self):
+        """Stop the save thread (its worker has already returned) and release it."""
+        self._save_thread.quit()
+        self._save_thread.wait()
+        self._save_worker.deleteLater()
+        self._save_thread.deleteLater()
+        self._save_worker = None
+        self._save_thread = None
+        self.save_btn.setEnabled(True)
+        self.cancel_btn.setEnabled(True)
+
+    def _on_save_finished(self, groove: DrumGroove):
+        self._finish_save_thread()
+        # The library (and its name model) is only touched from the GUI thread
+        self.library.add_groove(groove)
+        # The parent confirms the save non-modally (see grooveSaved)
+        self.grooveSaved.emit(groove)
+        self.accept()
+
+    def _on_save_failed(self, error: str):
+        self._finish_save_thread()
+        print(f"Failed to save groove: {error}")
+        QMessageBox.critical(self, "Error", f"Failed to save groove: {error}")
+
+    def reject(self):
+        # Escape must not close the dialog while a save is still writing
+        if self._save_thread is not None:
+            return
+        super().reject()
 
     def load_groove_for_editing(self, groove: DrumGroove):
         """Load an existing groove for editing."""
         self.current_groove = groove
         self.name_edit.setText(groove.name)
-        self.beats_spin.setValue(groove.beats_per_bar)
 
-        for i in range(self.subdiv_combo.count()):
-            if self.subdiv_combo.itemData(i) == groove.subdivision:
-                self.subdiv_combo.setCurrentIndex(i)
-                break
+        # The grid takes its dimensions from load_groove, so setting the controls
+        # must not also trigger settings-changed resizes
+        with _signals_blocked(self.beats_spin, self.subdiv_combo, self.bars_spin):
+            self.beats_spin.setValue(groove.beats_per_bar)
+
+            idx = self._subdiv_index_by_data.get(groove.subdivision)
+            if idx is not None:
+                self.subdiv_combo.setCurrentIndex(idx)
+
+            self.bars_spin.setValue(groove.bars)
 
-        self.bars_spin.setValue(groove.bars)
+        # A resize still pending from earlier edits would clear the loaded notes
+        self._settings_timer.stop()
         self.note_grid.load_groove(groove)
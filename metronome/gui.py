@@ -1,4 +1,4 @@
-from PyQt5.QtCore import Qt, QSize, QThread, pyqtSignal, pyqtSlot, QTimer
+from PyQt5.QtCore import Qt, QRect, QSize, QThread, pyqtSignal, pyqtSlot, QTimer
 from PyQt5.QtWidgets import (
     QWidget,
     QMainWindow,
@@ -16,7 +16,8 @@ from PyQt5.QtWidgets import (
     QScrollArea,
     QFrame,
 )
-from PyQt5.QtGui import QPainter, QColor, QFont
+from PyQt5.QtGui import QPainter, QColor, QFont, QBrush, QPixmap
+from typing import List, Optional, Tuple
 
 from .engine import MetronomeEngine, TempoLadderRoutine
 from .audio import ClickAudio
@@ -277,45 +278,101 @@ class BeatIndicator(QWidget):
         self.current_beat = 0
         self.flash = False
         self.setMinimumHeight(120)
+        # Circle brushes, built once rather than on every tick's repaint
+        self._brush_flash = QBrush(QColor("#ff4d4d"))
+        self._brush_current = QBrush(QColor("#ffb3b3"))
+        self._brush_idle = QBrush(QColor("#404040"))
+        # Circle rect per beat for the current size; rebuilt lazily after a resize or beat change
+        self._slot_rects: Optional[List[QRect]] = None
+        # Pre-rendered (flash, current, idle) circles at the current slot size
+        self._circle_pixmaps: Optional[Tuple[QPixmap, QPixmap, QPixmap]] = None
 
     def sizeHint(self):
         return QSize(300, 100)
 
     def set_beats(self, beats: int):
         self.beats_per_bar = max(1, beats)
+        self._invalidate_slots()
         self.update()
 
     def set_current(self, beat_idx: int, flash: bool):
+        if beat_idx == self.current_beat and flash == self.flash:
+            return
+        previous = self.current_beat
         self.current_beat = beat_idx
         self.flash = flash
-        self.update()
+
+        # Only the previous and the new current circle change colour; Qt merges
+        # both requests into one paint of just those two rects
+        rects = self._get_slot_rects()
+        for i in (previous, beat_idx):
+            if 0 <= i < len(rects):
+                self.update(rects[i].adjusted(-1, -1, 1, 1))
+
+    def resizeEvent(self, e):
+        self._invalidate_slots()
+        super().resizeEvent(e)
+
+    def _invalidate_slots(self):
+        # The circle pixmaps are sized to the slots, so they go stale together
+        self._slot_rects = None
+        self._circle_pixmaps = None
+
+    def _get_slot_rects(self) -> List[QRect]:
+        if self._slot_rects is None:
+            w = self.width()
+            h = self.height()
+            margin = 40
+
+            # Calculate spacing to spread circles across the entire width
+            slot_width = (w - 2 * margin) / self.beats_per_bar
+
+            # Radius should be limited by slot_width and height
+            radius = min(slot_width // 2, (h - 20) // 2)
+            radius = max(radius, 15)
+
+            cy = h // 2
+            rects = []
+            for i in range(self.beats_per_bar):
+                # Center of the slot for each beat
+                cx = margin + (i + 0.5) * slot_width
+                rects.append(QRect(int(cx - radius + 2), int(cy - radius + 2),
+                                   int(2 * radius - 4), int(2 * radius - 4)))
+            self._slot_rects = rects
+        return self._slot_rects
+
+    def _get_circle_pixmaps(self) -> Tuple[QPixmap, QPixmap, QPixmap]:
+        """Render each circle state once at the current size; painting is then a blit."""
+        if self._circle_pixmaps is None:
+            size = self._get_slot_rects()[0].size()
+            dpr = self.devicePixelRatioF()
+            pixmaps = []
+            for brush in (self._brush_flash, self._brush_current, self._brush_idle):
+                pixmap = QPixmap(size * dpr)
+                pixmap.setDevicePixelRatio(dpr)
+                pixmap.fill(Qt.transparent)
+                painter = QPainter(pixmap)
+                painter.setRenderHint(QPainter.Antialiasing)
+                painter.setPen(Qt.NoPen)
+                painter.setBrush(brush)
+                painter.drawEllipse(0, 0, size.width(), size.height())
+                painter.end()
+                pixmaps.append(pixmap)
+            self._circle_pixmaps = tuple(pixmaps)
+        return self._circle_pixmaps
 
     def paintEvent(self, e):
+        flash_pix, current_pix, idle_pix = self._get_circle_pixmaps()
         p = QPainter(self)
-        p.setRenderHint(QPainter.Antialiasing)
-        w = self.width()
-        h = self.height()
-        margin = 40
-        
-        # Calculate spacing to spread circles across the entire width
-        slot_width = (w - 2 * margin) / self.beats_per_bar
-        
-        # Radius should be limited by slot_width and height
-        radius = min(slot_width // 2, (h - 20) // 2)
-        radius = max(radius, 15)
-        
-        cy = h // 2
-        for i in range(self.beats_per_bar):
-            # Center of the slot for each beat
-            cx = margin + (i + 0.5) * slot_width
-            
+        exposed = e.rect()
+        for i, rect in enumerate(self._get_slot_rects()):
+            if not exposed.intersects(rect):
+                continue
             if i == self.current_beat:
-                color = QColor("#ff4d4d") if self.flash else QColor("#ffb3b3")
+                pixmap = flash_pix if self.flash else current_pix
             else:
-                color = QColor("#404040")
-            p.setBrush(color)
-            p.setPen(Qt.NoPen)
-            p.drawEllipse(int(cx - radius + 2), int(cy - radius + 2), int(2 * radius - 4), int(2 * radius - 4))
+                pixmap = idle_pix
+            p.drawPixmap(rect.topLeft(), pixmap)
 
 
 class MainWindow(QMainWindow):
@@ -334,7 +391,7 @@ class MainWindow(QMainWindow):
     sig_rudiment_lead_hand = pyqtSignal(str)
     sig_groove_start = pyqtSignal()
     sig_groove_stop = pyqtSignal()
-    sig_groove_set = pyqtSignal(str)
+    sig_groove_set = pyqtSignal(object)  # DrumGroove
     sig_groove_loop = pyqtSignal(int)
     sig_init_audio = pyqtSignal()
     sig_init_engine = pyqtSignal()
@@ -359,20 +416,23 @@ class MainWindow(QMainWindow):
 
         # Groove system
         self.groove_library = GrooveLibrary()
-        self.groove_routine = GrooveRoutine(self.engine, self.groove_library, parent=self.engine)
+        self.groove_routine = GrooveRoutine(self.engine, parent=self.engine)
 
         self.engine.moveToThread(self.worker_thread)
         self.audio.moveToThread(self.worker_thread)
         # routines move with engine because they are children
 
-        # Internal worker wiring
-        self.engine.click.connect(self.audio.play)
+        # Internal worker wiring (audio shares the engine's thread, so play synchronously)
+        self.engine.click.connect(self.audio.play, Qt.DirectConnection)
 
         # Helpers
         self.tap = TapTempo()
 
         # Local state tracking for UI
         self._running_state = False
+        self._ladder_running = False
+        self._rudiment_running = False
+        self._groove_running = False
 
         # UI
         main_widget = QWidget()
@@ -549,7 +609,7 @@ class MainWindow(QMainWindow):
         groove_top_row = QHBoxLayout()
         groove_top_row.addWidget(QLabel("Select Groove:"))
         self.groove_combo = QComboBox()
-        self.groove_combo.addItems(self.groove_library.get_groove_names())
+        self.groove_combo.setModel(self.groove_library.get_name_model())
         groove_top_row.addWidget(self.groove_combo, 1)
 
         self.btn_edit_groove = QPushButton("Edit Groove")
@@ -617,7 +677,7 @@ class MainWindow(QMainWindow):
         self.sig_update_sounds.connect(self.audio.set_sounds)
 
         # -- Feedback (Worker -> UI) --
-        self.engine.tick.connect(self._on_tick)
+        self.engine.tick.connect(self._on_tick, Qt.QueuedConnection)
         self.engine.bpmChanged.connect(self._on_bpm_changed)
         self.engine.runningChanged.connect(self._on_running_changed)
         self.audio.deviceChanged.connect(self._on_device_changed_info)
@@ -657,13 +717,23 @@ class MainWindow(QMainWindow):
         self.workout_timer.setInterval(1000)
         self.workout_timer.timeout.connect(self._update_workout_time)
         self.workout_seconds = 0
+
+        # Tick coalescing: _on_tick only records the latest step, and the indicator and
+        # staff are updated once per event-loop pass however many ticks were queued
+        self._pending_tick: Optional[Tuple[int, int, bool]] = None
+        self._pending_beat: Optional[int] = None
+        self._tick_timer = QTimer(self)
+        self._tick_timer.setSingleShot(True)
+        self._tick_timer.setInterval(0)
+        self._tick_timer.timeout.connect(self._apply_pending_tick)
         
         # Populate rudiments
         self.rudiment_widget.set_available_rudiments(self.rudiment_routine.get_rudiment_names())
 
         # Initialize drum staff with first groove
-        if self.groove_library.grooves:
-            first_groove = self.groove_library.grooves[0]
+        groove_names = self.groove_library.get_groove_names()
+        if groove_names:
+            first_groove = self.groove_library.get_groove_by_name(groove_names[0])
             self.drum_staff.set_groove(first_groove)
 
         # Populate audio devices
@@ -677,18 +747,33 @@ class MainWindow(QMainWindow):
     # Slots / handlers
     def _on_tick(self, step_idx: int, beat_idx: int, is_beat: bool, is_accent: bool):
         # Audio is handled by worker thread now.
+        self._pending_tick = (step_idx, beat_idx, is_beat)
+        if is_beat:
+            # Remember the beat even if later steps of the same batch supersede the tick
+            self._pending_beat = beat_idx
+        if not self._tick_timer.isActive():
+            self._tick_timer.start()
+
+    def _apply_pending_tick(self):
+        if self._pending_tick is None:
+            return
+        step_idx, beat_idx, is_beat = self._pending_tick
+        pending_beat = self._pending_beat
+        self._pending_tick = None
+        self._pending_beat = None
+
         # Update visual on beats
         if is_beat:
             self.indicator.set_current(beat_idx, True)
         else:
-            # turn off flash between steps
-            self.indicator.set_current(self.indicator.current_beat, False)
+            # turn off flash between steps (still moving to a beat that was coalesced away)
+            current = pending_beat if pending_beat is not None else self.indicator.current_beat
+            self.indicator.set_current(current, False)
 
         # Update drum staff position
         if self.groove_routine.running:
-            # step_idx is within the bar, calculate subdivision within current beat
-            subdivision = step_idx % self.engine.subdivision if self.engine.subdivision > 0 else 0
-            self.drum_staff.set_position(self.groove_routine._bar_in_groove, beat_idx, subdivision)
+            # Position from step_idx, the same index GrooveRoutine plays notes from
+            self.drum_staff.set_step(self.groove_routine._bar_in_groove, step_idx, self.engine.subdivision)
 
     def _update_workout_time(self):
         self.workout_seconds += 1
@@ -729,16 +814,9 @@ class MainWindow(QMainWindow):
         self.info.setText(f"BPM: {bpm}")
 
     def _toggle_routine(self):
-        if self.ladder.is_running(): # This calls a method on object in another thread. Is it safe?
-             # is_running() just reads self._running. It might race but boolean read is atomic.
-             # Better to track state locally or use exception.
-             # Let's assume ladder state is tracked by _routine_state
-             # But _routine_state updates button text.
-             pass
-        
-        # Actually, we should check button text or store state.
-        # Let's use the text or a flag.
-        if "Stop" in self.btn_routine.text():
+        # Ladder state is tracked locally by _routine_state rather than asking the
+        # worker-thread ladder or reading the button text back.
+        if self._ladder_running:
              self.sig_ladder_stop.emit()
              return
         
@@ -751,6 +829,7 @@ class MainWindow(QMainWindow):
         self.sig_ladder_start.emit()
 
     def _routine_state(self, running: bool):
+        self._ladder_running = running
         self.btn_routine.setText("Stop Ladder" if running else "Start Ladder")
         if not running:
             self.info.setText("Ladder stopped")
@@ -808,7 +887,7 @@ class MainWindow(QMainWindow):
         self._on_device_changed_info(self.audio.current_device_name(), self.audio.negotiated_format_summary())
 
     def _toggle_rudiment(self):
-        if "Stop" in self.btn_rudiment.text():
+        if self._rudiment_running:
             self.sig_rudiment_stop.emit()
         else:
             self.sig_rudiment_configure.emit(self.rud_bars.value())
@@ -817,6 +896,7 @@ class MainWindow(QMainWindow):
             self.sig_rudiment_start.emit()
 
     def _rudiment_active_changed(self, active: bool):
+        self._rudiment_running = active
         self.btn_rudiment.setText("Stop Rudiments" if active else "Start Rudiments")
         if not active:
              self.rudiment_widget.update_display(None, None)
@@ -825,19 +905,21 @@ class MainWindow(QMainWindow):
         self.rudiment_widget.update_display(current, next_r)
 
     def _toggle_groove(self):
-        if "Stop" in self.btn_groove.text():
+        if self._groove_running:
             self.sig_groove_stop.emit()
         else:
             # Set the selected groove
             groove_name = self.groove_combo.currentText()
-            if groove_name:
-                self.sig_groove_set.emit(groove_name)
+            groove = self.groove_library.get_groove_by_name(groove_name) if groove_name else None
+            if groove:
+                self.sig_groove_set.emit(groove)
                 self.sig_groove_loop.emit(self.groove_loop_spin.value())
                 if not self._running_state:
                     self.sig_start.emit()
                 self.sig_groove_start.emit()
 
     def _groove_active_changed(self, active: bool):
+        self._groove_running = active
         self.btn_groove.setText("Stop Groove" if active else "Start Groove")
         self.drum_staff.set_playing(active)
         if not active:
@@ -859,6 +941,9 @@ class MainWindow(QMainWindow):
 
     def _edit_groove(self):
         dialog = GrooveEditorDialog(self.groove_library, self)
+        # Free the dialog once closed; otherwise every editor ever opened stays parented
+        # to the window and keeps reacting to the shared name model
+        dialog.setAttribute(Qt.WA_DeleteOnClose)
 
         # Load current groove if one is selected
         current_name = self.groove_combo.currentText()
@@ -869,12 +954,14 @@ class MainWindow(QMainWindow):
 
         # Handle groove saved
         def on_groove_saved(groove: DrumGroove):
-            # Refresh combo box
-            self.groove_combo.clear()
-            self.groove_combo.addItems(self.groove_library.get_groove_names())
-            # Select the newly saved groove
+            self.statusBar().showMessage(f"Groove '{groove.name}' saved", 3000)
+            # The combo box shares the library's name model, which is already refreshed
             idx = self.groove_combo.findText(groove.name)
-            if idx >= 0:
+            if idx >= 0 and idx == self.groove_combo.currentIndex():
+                # Same entry, so no change signal: reload the edited groove directly
+                self._on_groove_selected(groove.name)
+            elif idx >= 0:
+                # Select the newly saved groove
                 self.groove_combo.setCurrentIndex(idx)
 
         dialog.grooveSaved.connect(on_groove_saved)
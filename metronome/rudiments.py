@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import List
 import random
-from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot
+from PyQt5.QtCore import Qt, QObject, pyqtSignal, pyqtSlot
 from .engine import MetronomeEngine
 
 @dataclass
@@ -37,6 +37,7 @@ class RudimentPracticeRoutine(QObject):
         self._current_rudiment = None
         self._next_rudiment = None
         self._lead_hand = 'R'  # 'R', 'L', 'Mixed'
+        self._connected = False
 
     @property
     def running(self):
@@ -103,12 +104,10 @@ class RudimentPracticeRoutine(QObject):
         self._current_rudiment = self._apply_lead_hand(random.choice(pool))
         self._next_rudiment = self._apply_lead_hand(random.choice(pool))
         
-        # Connect signals
-        try:
-            self._engine.barAdvanced.disconnect(self._on_bar_advanced)
-        except TypeError:
-            pass
-        self._engine.barAdvanced.connect(self._on_bar_advanced)
+        # Connect signals (tracked so we never double-connect)
+        if not self._connected:
+            self._engine.barAdvanced.connect(self._on_bar_advanced, Qt.UniqueConnection)
+            self._connected = True
         
         self.activeChanged.emit(True)
         self.rudimentChanged.emit(self._current_rudiment, self._next_rudiment)
@@ -119,10 +118,9 @@ class RudimentPracticeRoutine(QObject):
             return
         
         self._running = False
-        try:
+        if self._connected:
             self._engine.barAdvanced.disconnect(self._on_bar_advanced)
-        except TypeError:
-            pass
+            self._connected = False
             
         self.activeChanged.emit(False)
 
@@ -0,0 +1,40 @@
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtWidgets = pytest.importorskip("PyQt5.QtWidgets")
+
+from metronome.drum_staff import DrumStaffWidget
+from metronome.engine import MetronomeEngine
+from metronome.groove import GrooveRoutine, _build_motown
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+def test_offbeat_step_highlights(qapp):
+    groove = _build_motown()
+    engine = MetronomeEngine()
+    routine = GrooveRoutine(engine)
+    staff = DrumStaffWidget()
+    routine.notesPlaying.connect(staff.set_active_notes)
+    routine.set_groove(groove)
+    routine.start()
+    staff.set_groove(groove)
+    staff.set_playing(True)
+
+    # Step 6 is the kick on the "+" of beat 2; the engine's beat index for that
+    # tick has already moved on to beat 3
+    step, beat_idx = 6, 2
+    routine._on_tick(step, beat_idx, False, False)
+    assert staff.active_notes
+
+    staff.set_step(0, step, engine.subdivision)
+    assert staff._active_step() == step
+
+    # Positioning from the tick's beat index misses the hit
+    staff.set_position(0, beat_idx, step % engine.subdivision)
+    assert staff._active_step() == -1